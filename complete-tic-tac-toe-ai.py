@@ -1,26 +1,420 @@
 # Complete Tic-Tac-Toe AI Game - Ready to Play in Terminal
 
 
-import time
-import random
+import functools
 import os
+import pickle
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Windows consoles need virtual-terminal processing switched on once
+# before ANSI escape sequences (clear_screen) render correctly
+if os.name == 'nt':
+    os.system('')
+
+# Transposition-table entry flags (fail-soft alpha-beta bounds)
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+
+# Hoisted so the search never re-builds a float from a string per node
+INF = float('inf')
+NINF = -INF
+
+# Bitboard layout: bit (row * 3 + col) is set when that cell is occupied.
+# Octal groups the 9 bits into rows, so each mask reads bottom-row-first:
+# three rows, three columns, two diagonals.
+WIN_MASKS = (0o007, 0o070, 0o700, 0o111, 0o222, 0o444, 0o421, 0o124)
+FULL_BOARD = 0o777
+
+# Player identity as small ints: integer compares everywhere internally,
+# with symbols looked up only at the display boundary. DRAW is distinct
+# from both players and truthy so `if winner:` still reads naturally
+AI, HUMAN, EMPTY = 1, -1, 0
+DRAW = 2
+PLAYER_SYMBOL = {AI: 'X', HUMAN: 'O', EMPTY: ' '}
+
+# Cell indices in static search priority: center, corners, edges. Strong
+# moves first makes alpha-beta cutoffs happen far earlier than raster order
+MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+# Root subtrees are only worth farming out to worker processes while the
+# board is still wide open; below this many empty cells the serial search
+# finishes faster than the processes can be fed
+PARALLEL_MIN_EMPTIES = 7
+
+# Whether each of the 512 possible one-side bitboards contains a completed
+# line; a bytes object indexes with a single C-level fetch, beating any loop
+# over the eight masks
+WIN_LOOKUP = bytes(1 if any(b & m == m for m in WIN_MASKS) else 0
+                   for b in range(512))
+
+# The 8 symmetries of the board (D4 dihedral group) as index permutations:
+# bit i of a bitboard maps to bit SYMS[k][i] under transform k
+SYMS = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # identity
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # rotate 90
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # rotate 180
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # rotate 270
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # mirror columns
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # mirror rows
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # main diagonal
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),  # anti-diagonal
+)
+
+def _transform_bb(bb, perm):
+    """Apply one D4 index permutation to a 9-bit bitboard"""
+    out = 0
+    for i in range(9):
+        if bb >> i & 1:
+            out |= 1 << perm[i]
+    return out
+
+def _canonical(ai_bb, human_bb):
+    """Smallest (ai_bb, human_bb) pair over all 8 board symmetries"""
+    return min((_transform_bb(ai_bb, perm), _transform_bb(human_bb, perm))
+               for perm in SYMS)
+
+# Zobrist keys, one random 64-bit value per (cell, player). Module-level so
+# the search function below needs no instance state
+ZOBRIST = tuple((random.getrandbits(64), random.getrandbits(64))
+                for _ in range(9))
+# Side-to-move key, XORed into the hash whenever it is the human's turn.
+# Without it the same occupancy searched for either side would share a
+# table entry and return the wrong side's score
+ZOBRIST_SIDE = random.getrandbits(64)
+
+def _minimax(ai_bb, human_bb, h, depth, max_depth, is_maximizing, alpha, beta,
+             tt, killers, counter):
+    """
+    Minimax with alpha-beta pruning over plain-int bitboards
+
+    Operating on ints passed by value (no do/undo, no attribute access)
+    keeps the recursion free of interpreter-level object traffic, and the
+    node count lives in a shared one-element list rather than on the
+    instance (a subscript store is cheaper than an attribute store, and
+    returning bare ints spares a tuple allocation per node).
+
+    Args:
+        ai_bb, human_bb: 9-bit occupancy bitboards for each side
+        h: Zobrist hash of the position, including ZOBRIST_SIDE exactly
+           when is_maximizing is False
+        depth: Current depth in the game tree
+        max_depth: Depth limit; non-terminal nodes at the limit score 0
+        is_maximizing: True if AI turn (maximizing), False if human turn
+        alpha: Best value that maximizer can guarantee
+        beta: Best value that minimizer can guarantee
+        tt: Transposition table dict, hash -> (value, budget, flag, best_idx)
+           where budget is the lookahead the entry was searched with
+        killers: Per-depth list of the last cutoff move, or -1
+        counter: One-element list accumulating the node count
+
+    Returns:
+        Best score achievable from current position
+    """
+    counter[0] += 1
+
+    # Terminal conditions: one table fetch per side answers "contains a
+    # completed line", replacing the per-cell mask loops entirely
+    if WIN_LOOKUP[ai_bb]:
+        return 10 - depth  # Prefer faster wins
+    if WIN_LOOKUP[human_bb]:
+        return -10 + depth  # Prefer slower losses
+    empty_bb = ~(ai_bb | human_bb) & FULL_BOARD
+    if not empty_bb:
+        return 0
+
+    # Effective lookahead from this node: the depth limit or running out of
+    # board, whichever comes first. Entries searched with at least this much
+    # budget are trustworthy; shallower entries still provide a best move
+    budget = max_depth - depth
+    plies_left = empty_bb.bit_count()
+    if budget > plies_left:
+        budget = plies_left
+
+    # Transposition-table probe: positions reached by different move orders
+    # share a hash, so a stored result can answer immediately or tighten the
+    # alpha/beta window (fail-soft). Win/loss values are stored relative to
+    # the probed node and re-based to current depth.
+    tt_move = -1
+    entry = tt.get(h)
+    if entry is not None:
+        value, entry_budget, flag, tt_move = entry
+        if entry_budget >= budget:
+            if value > 0:
+                value -= depth
+            elif value < 0:
+                value += depth
+            if flag == TT_EXACT:
+                return value
+            if flag == TT_LOWER:
+                if value >= beta:
+                    return value
+                if value > alpha:
+                    alpha = value
+            else:  # TT_UPPER
+                if value <= alpha:
+                    return value
+                if value < beta:
+                    beta = value
+
+    # Depth limit reached on a non-terminal position: neutral heuristic.
+    # Exact scores only exist at terminals, but the shallow pass still
+    # seeds the table with best moves for the next deepening iteration
+    if budget <= 0:
+        return 0
+
+    alpha_original = alpha
+    beta_original = beta
+
+    # Try the table's best move first, then the killer move recorded at this
+    # depth (the move that last caused a cutoff at a sibling node), then the
+    # static priority order; the remaining mask guards against searching any
+    # move twice
+    order = MOVE_ORDER
+    killer = killers[depth]
+    if killer >= 0 and killer != tt_move:
+        order = (killer,) + order
+    if tt_move >= 0:
+        order = (tt_move,) + order
+    best_idx = -1
+
+    if is_maximizing:  # AI turn (trying to maximize score)
+        max_eval = NINF
+
+        remaining = empty_bb
+        for idx in order:
+            bit = 1 << idx
+            if not remaining & bit:
+                continue
+            remaining ^= bit
+
+            eval_score = _minimax(
+                ai_bb | bit, human_bb, h ^ ZOBRIST[idx][0] ^ ZOBRIST_SIDE,
+                depth + 1, max_depth, False, alpha, beta, tt, killers,
+                counter)
+
+            # Update best score and alpha
+            if eval_score > max_eval:
+                max_eval = eval_score
+                best_idx = idx
+            if eval_score > alpha:
+                alpha = eval_score
+
+            # Alpha-beta pruning
+            if beta <= alpha:
+                killers[depth] = idx
+                break
+
+        best = max_eval
+
+    else:  # Human turn (trying to minimize AI's score)
+        min_eval = INF
+
+        remaining = empty_bb
+        for idx in order:
+            bit = 1 << idx
+            if not remaining & bit:
+                continue
+            remaining ^= bit
+
+            eval_score = _minimax(
+                ai_bb, human_bb | bit, h ^ ZOBRIST[idx][1] ^ ZOBRIST_SIDE,
+                depth + 1, max_depth, True, alpha, beta, tt, killers,
+                counter)
+
+            # Update best score and beta
+            if eval_score < min_eval:
+                min_eval = eval_score
+                best_idx = idx
+            if eval_score < beta:
+                beta = eval_score
+
+            # Alpha-beta pruning
+            if beta <= alpha:
+                killers[depth] = idx
+                break
+
+        best = min_eval
+
+    # Store the result: an exact value if the search stayed inside the
+    # original window, otherwise the appropriate bound
+    value = best
+    if value > 0:
+        value += depth
+    elif value < 0:
+        value -= depth
+    if best <= alpha_original:
+        flag = TT_UPPER
+    elif best >= beta_original:
+        flag = TT_LOWER
+    else:
+        flag = TT_EXACT
+    tt[h] = (value, budget, flag, best_idx)
+
+    return best
+
+def _evaluate_move(ai_bb, human_bb, h, idx):
+    """
+    Worker for the parallel root split: fully search one root move in its
+    own process with private table/killer state, so only small ints ever
+    cross the process boundary
+    Returns: (cell index, score, nodes evaluated)
+    """
+    counter = [0]
+    score = _minimax(ai_bb | 1 << idx, human_bb,
+                     h ^ ZOBRIST[idx][0] ^ ZOBRIST_SIDE,
+                     0, 9, False, NINF, INF, {}, [-1] * 10, counter)
+    return idx, score, counter[0]
+
+@functools.cache
+def _solve(ai_bb, human_bb, ai_to_move):
+    """
+    Exact game value (AI perspective, faster wins preferred) and best move
+    for a position; memoization collapses the game to its ~5,500 reachable
+    positions so the whole tree solves once per process
+
+    Returns:
+        (value, best_idx) tuple, best_idx is -1 at terminal positions
+    """
+    if WIN_LOOKUP[ai_bb]:
+        return 10, -1
+    if WIN_LOOKUP[human_bb]:
+        return -10, -1
+    empty_bb = ~(ai_bb | human_bb) & FULL_BOARD
+    if not empty_bb:
+        return 0, -1
+
+    best_idx = -1
+    if ai_to_move:
+        best = NINF
+        for idx in MOVE_ORDER:
+            bit = 1 << idx
+            if not empty_bb & bit:
+                continue
+            value, _ = _solve(ai_bb | bit, human_bb, False)
+            if value > best:
+                best = value
+                best_idx = idx
+    else:
+        best = INF
+        for idx in MOVE_ORDER:
+            bit = 1 << idx
+            if not empty_bb & bit:
+                continue
+            value, _ = _solve(ai_bb, human_bb | bit, True)
+            if value < best:
+                best = value
+                best_idx = idx
+
+    # One ply further from the root: decay toward zero so nearer wins and
+    # more distant losses score better, matching the minimax depth bonus
+    if best > 0:
+        best -= 1
+    elif best < 0:
+        best += 1
+    return best, best_idx
+
+def _build_policy():
+    """
+    Optimal move for every position reachable in normal play with the AI
+    to move, for both possible starting players
+    Returns: dict mapping (ai_bb, human_bb) -> best cell index
+    """
+    policy = {}
+    seen = set()
+
+    def visit(ai_bb, human_bb, ai_to_move):
+        state = (ai_bb, human_bb, ai_to_move)
+        if state in seen:
+            return
+        seen.add(state)
+
+        value, best_idx = _solve(ai_bb, human_bb, ai_to_move)
+        if best_idx < 0:  # Terminal position
+            return
+        if ai_to_move:
+            policy[(ai_bb, human_bb)] = best_idx
+
+        empty_bb = ~(ai_bb | human_bb) & FULL_BOARD
+        while empty_bb:
+            lsb = empty_bb & -empty_bb
+            empty_bb ^= lsb
+            if ai_to_move:
+                visit(ai_bb | lsb, human_bb, False)
+            else:
+                visit(ai_bb, human_bb | lsb, True)
+
+    visit(0, 0, True)   # AI moves first
+    visit(0, 0, False)  # Human moves first
+    return policy
+
+# Policy cache sits next to the module so one solve serves every run
+POLICY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           'policy.pkl')
+
+def _load_policy():
+    """Load the precomputed policy, rebuilding (and re-saving) if missing"""
+    try:
+        with open(POLICY_FILE, 'rb') as f:
+            policy = pickle.load(f)
+        # Corrupted bytes can unpickle to anything; only trust a dict
+        if isinstance(policy, dict):
+            return policy
+    except Exception:
+        # pickle.load on a damaged file raises far more than PickleError
+        # (ValueError, UnicodeDecodeError, ImportError, ...); any failure
+        # here just means we rebuild from scratch
+        pass
+
+    policy = _build_policy()
+    try:
+        with open(POLICY_FILE, 'wb') as f:
+            pickle.dump(policy, f)
+    except OSError:
+        pass  # Read-only install location; solve again next run
+    return policy
 
 class TicTacToeAI:
     """
     Complete Tic-Tac-Toe AI implementation with minimax algorithm and alpha-beta pruning.
     Features an unbeatable AI with interactive terminal gameplay.
     """
-    
+
+    # Fixed-offset attribute storage: no per-instance __dict__, and every
+    # self.<attr> read in the game loop skips the dict lookup
+    __slots__ = ('board', 'ai_bb', 'human_bb', 'human_player', 'ai_player',
+                 'nodes_evaluated', 'game_stats', 'hash', 'tt', 'killers',
+                 'policy', '_executor')
+
     def __init__(self):
-        self.board = [[' ' for _ in range(3)] for _ in range(3)]
-        self.human_player = 'O'
-        self.ai_player = 'X'
+        self.board = [[EMPTY for _ in range(3)] for _ in range(3)]
+        # Bitboard mirror of self.board used by the search hot path;
+        # self.board stays authoritative for display and input handling
+        self.ai_bb = 0
+        self.human_bb = 0
+        self.human_player = HUMAN
+        self.ai_player = AI
         self.nodes_evaluated = 0
         self.game_stats = {'human_wins': 0, 'ai_wins': 0, 'draws': 0}
+
+        # Zobrist hash of the current position (see module-level ZOBRIST)
+        self.hash = 0
+        # Transposition table: hash -> (value, depth, flag, best_idx)
+        self.tt = {}
+        # Killer moves: last cutoff move per search depth
+        self.killers = [-1] * 10
+        # Precomputed optimal policy: (ai_bb, human_bb) -> best cell index
+        self.policy = _load_policy()
+        # Worker pool for the parallel root split, created on first use
+        # since the policy table answers normal play without searching
+        self._executor = None
     
     def clear_screen(self):
         """Clear the terminal screen for better user experience"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # One ANSI write instead of forking a cls/clear subprocess
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
     
     def print_welcome(self):
         """Print welcome message and game instructions"""
@@ -28,8 +422,8 @@ class TicTacToeAI:
         print("=" * 60)
         print("🎮 WELCOME TO TIC-TAC-TOE AI CHALLENGE 🎮")
         print("=" * 60)
-        print(f"🤖 AI Player: {self.ai_player} (Unbeatable with Minimax Algorithm)")
-        print(f"👤 Human Player: {self.human_player} (That's you!)")
+        print(f"🤖 AI Player: {PLAYER_SYMBOL[self.ai_player]} (Unbeatable with Minimax Algorithm)")
+        print(f"👤 Human Player: {PLAYER_SYMBOL[self.human_player]} (That's you!)")
         print()
         print("📋 HOW TO PLAY:")
         print("   • Enter coordinates as 'row col' (both 0-2)")
@@ -47,7 +441,8 @@ class TicTacToeAI:
         print("   ├───┼───┼───┤")
         
         for i in range(3):
-            row_display = f" {i} │ {self.board[i][0]} │ {self.board[i][1]} │ {self.board[i][2]} │"
+            cells = [PLAYER_SYMBOL[c] for c in self.board[i]]
+            row_display = f" {i} │ {cells[0]} │ {cells[1]} │ {cells[2]} │"
             print(row_display)
             if i < 2:
                 print("   ├───┼───┼───┤")
@@ -72,9 +467,16 @@ class TicTacToeAI:
     
     def reset_game(self):
         """Reset the game board for a new game"""
-        self.board = [[' ' for _ in range(3)] for _ in range(3)]
+        self.board = [[EMPTY for _ in range(3)] for _ in range(3)]
+        self.ai_bb = 0
+        self.human_bb = 0
         self.nodes_evaluated = 0
-    
+        self.hash = 0
+        # The hash encodes side-to-move (ZOBRIST_SIDE), so stale entries
+        # would still be correct; cleared anyway so the table never grows
+        # across games
+        self.tt.clear()
+
     def make_move(self, row, col, player):
         """
         Make a move with comprehensive input validation and error handling
@@ -91,8 +493,13 @@ class TicTacToeAI:
             print(f"❌ Invalid coordinates! Please enter numbers 0-2.")
             return False
         
-        # Validate player
-        if player not in ['X', 'O']:
+        # Validate player, accepting the legacy 'X'/'O' symbols from
+        # external callers alongside the internal int constants
+        if player == 'X':
+            player = AI
+        elif player == 'O':
+            player = HUMAN
+        if player not in (AI, HUMAN):
             print(f"❌ Invalid player '{player}'. Must be 'X' or 'O'.")
             return False
         
@@ -102,150 +509,227 @@ class TicTacToeAI:
             return False
         
         # Check if position is empty
-        if self.board[row][col] != ' ':
-            print(f"❌ Position ({row}, {col}) is already occupied by '{self.board[row][col]}'!")
+        if self.board[row][col] != EMPTY:
+            occupant = PLAYER_SYMBOL[self.board[row][col]]
+            print(f"❌ Position ({row}, {col}) is already occupied by '{occupant}'!")
             return False
         
         # Make the move
-        self.board[row][col] = player
+        self._apply(row, col, player)
         return True
+
+    def _apply(self, row, col, player):
+        """
+        Place a validated move: internal path for callers that already hold
+        trusted integer coordinates (the AI's own moves), skipping
+        make_move's type coercion and bounds checks
+        """
+        self.board[row][col] = player
+        if player == self.ai_player:
+            self.ai_bb |= 1 << (row * 3 + col)
+            self.hash ^= ZOBRIST[row * 3 + col][0]
+        else:
+            self.human_bb |= 1 << (row * 3 + col)
+            self.hash ^= ZOBRIST[row * 3 + col][1]
     
     def check_winner(self):
         """
         Check for a winner or draw
-        Returns: 'X', 'O', 'Draw', or None (game continues)
+        Returns: AI, HUMAN, DRAW, or None (game continues)
         """
-        # Check rows
-        for row in self.board:
-            if row[0] == row[1] == row[2] and row[0] != ' ':
-                return row[0]
-        
-        # Check columns
-        for col in range(3):
-            if self.board[0][col] == self.board[1][col] == self.board[2][col] and self.board[0][col] != ' ':
-                return self.board[0][col]
-        
-        # Check diagonals
-        if self.board[0][0] == self.board[1][1] == self.board[2][2] and self.board[0][0] != ' ':
-            return self.board[0][0]
-        
-        if self.board[0][2] == self.board[1][1] == self.board[2][0] and self.board[0][2] != ' ':
-            return self.board[0][2]
-        
-        # Check for draw
-        if all(self.board[i][j] != ' ' for i in range(3) for j in range(3)):
-            return 'Draw'
-        
+        # The bitboards mirror the display board, so the mask-based check
+        # answers this without walking the list-of-strings grid
+        return self.check_winner_fast()
+
+    def check_winner_fast(self):
+        """
+        Bitboard version of check_winner used by the search hot path
+        Returns: AI, HUMAN, DRAW, or None (game continues)
+        """
+        ai_bb = self.ai_bb
+        if WIN_LOOKUP[ai_bb]:
+            return self.ai_player
+        human_bb = self.human_bb
+        if WIN_LOOKUP[human_bb]:
+            return self.human_player
+        if ai_bb | human_bb == FULL_BOARD:
+            return DRAW
         return None
-    
+
     def evaluate_board(self):
         """
         Evaluate board state numerically for minimax algorithm
         Returns: +10 for AI win, -10 for human win, 0 for draw/ongoing
         """
-        winner = self.check_winner()
-        if winner == self.ai_player:
+        # Draw and ongoing both score 0, so two table fetches suffice
+        if WIN_LOOKUP[self.ai_bb]:
             return 10
-        elif winner == self.human_player:
+        if WIN_LOOKUP[self.human_bb]:
             return -10
-        else:
-            return 0
+        return 0
     
     def get_empty_positions(self):
         """Get all empty positions on the board"""
-        return [(i, j) for i in range(3) for j in range(3) if self.board[i][j] == ' ']
+        return [(i, j) for i in range(3) for j in range(3) if self.board[i][j] == EMPTY]
     
-    def minimax(self, depth, is_maximizing, alpha=float('-inf'), beta=float('inf')):
+    def minimax(self, depth, is_maximizing, alpha=NINF, beta=INF, max_depth=9):
         """
         Minimax algorithm with alpha-beta pruning for optimal AI play
-        
+
+        Thin wrapper around the module-level _minimax, which does the actual
+        recursion on plain-int bitboards; see its docstring for details.
+
         Args:
             depth: Current depth in the game tree
             is_maximizing: True if AI turn (maximizing), False if human turn (minimizing)
             alpha: Best value that maximizer can guarantee
             beta: Best value that minimizer can guarantee
-        
+            max_depth: Depth limit for the search (9 searches to the end)
+
         Returns:
             Best score achievable from current position
         """
-        self.nodes_evaluated += 1
-        
-        # Check if game is over
-        score = self.evaluate_board()
-        
-        # Terminal conditions
-        if score == 10:  # AI wins
-            return score - depth  # Prefer faster wins
-        if score == -10:  # Human wins
-            return score + depth  # Prefer slower losses
-        if not self.get_empty_positions():  # Draw
-            return 0
-        
-        if is_maximizing:  # AI turn (trying to maximize score)
-            max_eval = float('-inf')
-            
-            for row, col in self.get_empty_positions():
-                # Try this move
-                self.board[row][col] = self.ai_player
-                eval_score = self.minimax(depth + 1, False, alpha, beta)
-                self.board[row][col] = ' '  # Undo move
-                
-                # Update best score and alpha
-                max_eval = max(max_eval, eval_score)
-                alpha = max(alpha, eval_score)
-                
-                # Alpha-beta pruning
-                if beta <= alpha:
-                    break
-            
-            return max_eval
-        
-        else:  # Human turn (trying to minimize AI's score)
-            min_eval = float('inf')
-            
-            for row, col in self.get_empty_positions():
-                # Try this move
-                self.board[row][col] = self.human_player
-                eval_score = self.minimax(depth + 1, True, alpha, beta)
-                self.board[row][col] = ' '  # Undo move
-                
-                # Update best score and beta
-                min_eval = min(min_eval, eval_score)
-                beta = min(beta, eval_score)
-                
-                # Alpha-beta pruning
-                if beta <= alpha:
-                    break
-            
-            return min_eval
-    
+        counter = [0]
+        # self.hash tracks occupancy only; fold in the side key here so the
+        # table never confuses the two sides at the same occupancy
+        h = self.hash if is_maximizing else self.hash ^ ZOBRIST_SIDE
+        score = _minimax(self.ai_bb, self.human_bb, h,
+                         depth, max_depth, is_maximizing, alpha, beta,
+                         self.tt, self.killers, counter)
+        self.nodes_evaluated += counter[0]
+        return score
+
     def get_best_move(self):
         """
         Find the best move for the AI using minimax algorithm
         Returns: (row, col) tuple of the best move
         """
         self.nodes_evaluated = 0
-        best_val = float('-inf')
-        best_move = (-1, -1)
-        
-        empty_positions = self.get_empty_positions()
-        if not empty_positions:
-            return best_move
-        
-        # Evaluate all possible moves
-        for row, col in empty_positions:
-            # Try this move
-            self.board[row][col] = self.ai_player
-            move_val = self.minimax(0, False)  # Next turn is human (minimizing)
-            self.board[row][col] = ' '  # Undo move
-            
-            # If this move is better, update best_move
+        self.killers = [-1] * 10
+
+        empty_bb = ~(self.ai_bb | self.human_bb) & FULL_BOARD
+        if not empty_bb:
+            return (-1, -1)
+
+        # Any position reachable in normal play answers from the precomputed
+        # policy in one dict lookup, no search at all
+        policy_idx = self.policy.get((self.ai_bb, self.human_bb), -1)
+        if policy_idx >= 0:
+            return divmod(policy_idx, 3)
+
+        # Fallback for positions set up outside normal alternating play
+        # (direct board manipulation, tests, corrupted cache).
+        # Root subtrees are independent, so wide positions split across
+        # worker processes; anything narrower searches serially below
+        if empty_bb.bit_count() >= PARALLEL_MIN_EMPTIES:
+            move = self._parallel_root_search(empty_bb)
+            if move is not None:
+                self.policy[(self.ai_bb, self.human_bb)] = move[0] * 3 + move[1]
+                return move
+
+        # Iterative deepening: each shallow pass seeds the transposition
+        # table and killer slots so the next, deeper pass gets near-optimal
+        # move ordering; the final pass (depth 9) searches to the end and
+        # decides the move. Root moves are re-sorted by the previous pass's
+        # scores so the best candidate is searched first.
+        root_order = [idx for idx in MOVE_ORDER if empty_bb & (1 << idx)]
+        best_idx = root_order[0]
+        for max_depth in range(1, 10):
+            best_idx, scores = self._root_search(max_depth, root_order)
+            scores.sort(key=lambda pair: pair[1], reverse=True)
+            root_order = [idx for idx, _ in scores]
+
+        # Once decided, a position's best move never changes; remembering it
+        # lets a repeat visit anywhere in the session answer like any other
+        # policy hit instead of re-searching
+        self.policy[(self.ai_bb, self.human_bb)] = best_idx
+        return divmod(best_idx, 3)
+
+    def _root_search(self, max_depth, root_order):
+        """
+        One depth-limited pass over the root moves
+        Returns: (best cell index, [(cell index, score), ...]) for re-sorting
+        """
+        best_val = NINF
+        best_idx = root_order[0]
+        scores = []
+        counter = [0]
+
+        # Skip moves whose resulting position is a rotation/reflection of
+        # one already searched (on an empty board this cuts the root from
+        # 9 candidate moves to 3)
+        seen_children = set()
+        for idx in root_order:
+            bit = 1 << idx
+
+            canon = _canonical(self.ai_bb | bit, self.human_bb)
+            if canon in seen_children:
+                continue
+            seen_children.add(canon)
+
+            # Search the position after this move (next turn is human,
+            # minimizing); child boards are passed by value, no do/undo
+            move_val = _minimax(
+                self.ai_bb | bit, self.human_bb,
+                self.hash ^ ZOBRIST[idx][0] ^ ZOBRIST_SIDE,
+                0, max_depth, False, NINF, INF,
+                self.tt, self.killers, counter)
+            scores.append((idx, move_val))
+
+            # If this move is better, update best_idx
             if move_val > best_val:
-                best_move = (row, col)
+                best_idx = idx
                 best_val = move_val
-        
-        return best_move
-    
+
+        self.nodes_evaluated += counter[0]
+        return best_idx, scores
+
+    def _parallel_root_search(self, empty_bb):
+        """
+        Evaluate the root moves concurrently, one subtree per process
+        Returns: (row, col) of the best move, or None if no pool available
+        """
+        if self._executor is None:
+            try:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=os.cpu_count())
+            except OSError:
+                return None  # Restricted environment; use the serial path
+
+        try:
+            # Submit one canonical representative per symmetry class, same
+            # reduction the serial root applies
+            seen_children = set()
+            futures = []
+            for idx in MOVE_ORDER:
+                bit = 1 << idx
+                if not empty_bb & bit:
+                    continue
+                canon = _canonical(self.ai_bb | bit, self.human_bb)
+                if canon in seen_children:
+                    continue
+                seen_children.add(canon)
+                futures.append(self._executor.submit(
+                    _evaluate_move, self.ai_bb, self.human_bb,
+                    self.hash, idx))
+
+            best_idx = -1
+            best_val = NINF
+            for future in as_completed(futures):
+                idx, score, nodes = future.result()
+                self.nodes_evaluated += nodes
+                if score > best_val:
+                    best_val = score
+                    best_idx = idx
+        except (OSError, RuntimeError, pickle.PicklingError):
+            # Pool died, could not spawn workers, or the module is not
+            # importable from a child process; drop the pool and let the
+            # caller fall through to the serial search
+            self._executor = None
+            return None
+
+        return divmod(best_idx, 3)
+
     def ai_turn(self):
         """Handle AI's turn with dramatic effect"""
         print(f"\n🤖 AI is thinking", end="")
@@ -261,7 +745,7 @@ class TicTacToeAI:
         
         if best_move != (-1, -1):
             row, col = best_move
-            self.make_move(row, col, self.ai_player)
+            self._apply(row, col, self.ai_player)
             
             print(f"\n🎯 AI chooses position ({row}, {col})")
             print(f"⚡ Calculated in {calculation_time:.3f} seconds")
@@ -274,7 +758,7 @@ class TicTacToeAI:
     
     def human_turn(self):
         """Handle human player's turn with input validation"""
-        print(f"\n👤 Your turn ({self.human_player})!")
+        print(f"\n👤 Your turn ({PLAYER_SYMBOL[self.human_player]})!")
         
         while True:
             try:
@@ -308,7 +792,7 @@ class TicTacToeAI:
                 row, col = parts[0].strip(), parts[1].strip()
                 
                 if self.make_move(row, col, self.human_player):
-                    print(f"✅ You placed {self.human_player} at position ({int(row)}, {int(col)})")
+                    print(f"✅ You placed {PLAYER_SYMBOL[self.human_player]} at position ({int(row)}, {int(col)})")
                     return True
                 else:
                     print("🔄 Please try again...")
@@ -363,14 +847,14 @@ class TicTacToeAI:
                     # Check if game is over
                     winner = self.check_winner()
                     if winner:
-                        if winner == 'Draw':
+                        if winner == DRAW:
                             print("\n🤝 It's a draw! Great game!")
                             self.game_stats['draws'] += 1
                         elif winner == self.ai_player:
-                            print(f"\n🤖 AI wins with {self.ai_player}! Better luck next time!")
+                            print(f"\n🤖 AI wins with {PLAYER_SYMBOL[self.ai_player]}! Better luck next time!")
                             self.game_stats['ai_wins'] += 1
                         else:
-                            print(f"\n🎉 Congratulations! You won with {self.human_player}!")
+                            print(f"\n🎉 Congratulations! You won with {PLAYER_SYMBOL[self.human_player]}!")
                             print("🏆 You've achieved the impossible - beating an unbeatable AI!")
                             self.game_stats['human_wins'] += 1
                         